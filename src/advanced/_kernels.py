@@ -0,0 +1,39 @@
+"""
+Numeric kernels for grid and TWAP order math (kept free of API calls)
+"""
+from typing import List, Tuple
+
+
+def grid_levels_kernel(lower_price: float, upper_price: float, grid_levels: int, price_precision: int) -> List[float]:
+    """
+    Compute ascending grid prices rounded to the symbol's price precision
+    
+    Args:
+        lower_price: Lower bound of price range
+        upper_price: Upper bound of price range
+        grid_levels: Number of grid levels (returns grid_levels + 1 prices)
+        price_precision: Number of decimals to round each price to
+    
+    Returns:
+        List of grid prices from lower_price to upper_price
+    """
+    price_step = (upper_price - lower_price) / grid_levels
+    return [round(lower_price + i * price_step, price_precision) for i in range(grid_levels + 1)]
+
+
+def twap_schedule_kernel(total_steps: int, num_intervals: int, duration_seconds: float) -> Tuple[List[int], float]:
+    """
+    Split a TWAP order into slices of whole step sizes
+    
+    Args:
+        total_steps: Total quantity to trade, as a number of step sizes
+        num_intervals: Number of intervals to split the order
+        duration_seconds: Total duration in seconds
+    
+    Returns:
+        Tuple of (step sizes per slice, interval length in seconds); the
+        remainder of the division goes one step each to the first slices
+    """
+    steps_per_slice, remainder = divmod(total_steps, num_intervals)
+    slice_steps = [steps_per_slice + 1] * remainder + [steps_per_slice] * (num_intervals - remainder)
+    return slice_steps, duration_seconds / num_intervals
@@ -1,14 +1,18 @@
 """
 Grid Orders - Automated buy-low/sell-high within a price range
 """
-from typing import Dict, Any, Optional, List
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Optional
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 from ..basic_bot import BasicBot
+from ._kernels import grid_levels_kernel
 
 
 class GridOrders(BasicBot):
     """Handle grid trading orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_grid_orders(
         self,
         symbol: str,
@@ -57,16 +61,25 @@ class GridOrders(BasicBot):
             self.logger.error(f"Invalid order_type: {order_type}")
             return None
         
-        # Calculate grid prices
-        price_step = (upper_price - lower_price) / grid_levels
-        grid_prices = [lower_price + i * price_step for i in range(grid_levels + 1)]
+        precision = self.get_precision(symbol)
+        formatters = self.make_formatter(symbol)
+        if precision is None or formatters is None:
+            self.logger.error(f"Failed to fetch symbol info for {symbol}")
+            return None
+        format_quantity, format_price = formatters
         
-        # Format values
-        formatted_quantity = self.format_quantity(symbol, quantity_per_grid)
-        if formatted_quantity is None:
-            self.logger.error(f"Failed to format quantity for {symbol}")
+        # Calculate grid prices, rounded to the symbol's price precision up front
+        price_precision = precision[1]
+        grid_prices = grid_levels_kernel(lower_price, upper_price, grid_levels, price_precision)
+        if not all(self.validate_prices_bulk(grid_prices)):
+            self.logger.error(f"Invalid grid prices after rounding to {price_precision} decimals")
             return None
         
+        # Format values, rejecting per-level quantities that round below the minimum
+        if not self._meets_min_quantity(symbol, self._quantity_to_steps(symbol, quantity_per_grid), quantity_per_grid):
+            return None
+        formatted_quantity = format_quantity(quantity_per_grid)
+        
         # Log request
         self.log_order_request(
             "GRID",
@@ -86,59 +99,56 @@ class GridOrders(BasicBot):
             ticker = self.client.futures_symbol_ticker(symbol=symbol)
             current_price = float(ticker['price'])
             
-            # Place buy orders below current price
-            for price in grid_prices:
-                if price < current_price:
-                    formatted_price = self.format_price(symbol, price)
-                    if formatted_price is None:
-                        continue
-                    
-                    if order_type == 'LIMIT':
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='BUY',
-                            type='LIMIT',
-                            quantity=formatted_quantity,
-                            price=formatted_price,
-                            timeInForce='GTC'
-                        )
-                    else:
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='BUY',
-                            type='MARKET',
-                            quantity=formatted_quantity
-                        )
-                    
-                    buy_orders.append(order)
-                    self.logger.info(f"Grid BUY order placed at {formatted_price}: {order.get('orderId')}")
+            # Grid prices are ascending: split into buys below and sells above current price
+            buy_prices = grid_prices[:bisect_left(grid_prices, current_price)]
+            sell_prices = grid_prices[bisect_right(grid_prices, current_price):]
             
-            # Place sell orders above current price
-            for price in grid_prices:
-                if price > current_price:
-                    formatted_price = self.format_price(symbol, price)
-                    if formatted_price is None:
-                        continue
-                    
-                    if order_type == 'LIMIT':
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='SELL',
-                            type='LIMIT',
-                            quantity=formatted_quantity,
-                            price=formatted_price,
-                            timeInForce='GTC'
-                        )
-                    else:
-                        order = self.client.futures_create_order(
-                            symbol=symbol,
-                            side='SELL',
-                            type='MARKET',
-                            quantity=formatted_quantity
-                        )
-                    
+            # Keep levels as parallel side/price-string lists; dicts are only built for the REST call
+            sides = ['BUY'] * len(buy_prices) + ['SELL'] * len(sell_prices)
+            price_strs = [format_price(price) for price in buy_prices + sell_prices]
+            
+            if order_type == 'LIMIT':
+                payloads = [
+                    {
+                        'symbol': symbol,
+                        'side': side,
+                        'type': 'LIMIT',
+                        'quantity': formatted_quantity,
+                        'price': price_str,
+                        'timeInForce': 'GTC'
+                    }
+                    for side, price_str in zip(sides, price_strs)
+                ]
+            else:
+                payloads = [
+                    {
+                        'symbol': symbol,
+                        'side': side,
+                        'type': 'MARKET',
+                        'quantity': formatted_quantity
+                    }
+                    for side in sides
+                ]
+            
+            # Submit levels in concurrent batchOrders requests; one rejection doesn't cancel the rest
+            results = self._run_async(self._create_orders_batched(payloads))
+            
+            log_info = self.logger.info
+            failed_orders = 0
+            for side, price_str, order in zip(sides, price_strs, results):
+                if isinstance(order, Exception):
+                    failed_orders += 1
+                    self.log_error(order, f"placing grid {side} order at {price_str} for {symbol}")
+                    continue
+                
+                if side == 'BUY':
+                    buy_orders.append(order)
+                else:
                     sell_orders.append(order)
-                    self.logger.info(f"Grid SELL order placed at {formatted_price}: {order.get('orderId')}")
+                log_info("Grid %s order placed at %s: %s", side, price_str, order.get('orderId'))
+            
+            if failed_orders and not (buy_orders or sell_orders):
+                return None
             
             result = {
                 'buy_orders': buy_orders,
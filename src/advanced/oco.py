@@ -1,7 +1,8 @@
 """
 OCO (One-Cancels-the-Other) Orders - Place take-profit and stop-loss simultaneously
 """
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, List, Tuple
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 from ..basic_bot import BasicBot
 
@@ -9,6 +10,8 @@ from ..basic_bot import BasicBot
 class OCOOrders(BasicBot):
     """Handle OCO orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_oco_order(
         self,
         symbol: str,
@@ -39,7 +42,8 @@ class OCOOrders(BasicBot):
             self.logger.error(f"Invalid symbol: {symbol}")
             return None
         
-        if side.upper() not in ['BUY', 'SELL']:
+        side = side.upper()
+        if side not in ['BUY', 'SELL']:
             self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
             return None
         
@@ -47,7 +51,7 @@ class OCOOrders(BasicBot):
             self.logger.error(f"Invalid quantity: {quantity}")
             return None
         
-        if not all(self.validate_price(p) for p in [price, stop_price, limit_price]):
+        if not all(self.validate_prices_bulk([price, stop_price, limit_price])):
             self.logger.error(f"Invalid price values")
             return None
         
@@ -64,13 +68,15 @@ class OCOOrders(BasicBot):
         self.log_order_request(
             "OCO",
             symbol,
-            side.upper(),
+            side,
             quantity=formatted_quantity,
             stop_price=formatted_stop_price,
             limit_price=formatted_limit_price,
             reduce_only=reduce_only
         )
         
+        orders = {}
+        
         try:
             # For OCO, we place two orders:
             # 1. Stop-loss order (STOP type)
@@ -78,31 +84,32 @@ class OCOOrders(BasicBot):
             # Note: Binance Futures doesn't have native OCO, so we implement it by placing
             # two conditional orders and monitoring them
             
-            orders = {}
+            # Both legs close the position, so they go on the opposite side
+            exit_side = 'SELL' if side == 'BUY' else 'BUY'
             
-            # Place stop-loss order
-            stop_order = self.client.futures_create_order(
-                symbol=symbol,
-                side='SELL' if side.upper() == 'BUY' else 'BUY',  # Opposite side for stop-loss
-                type='STOP_MARKET',
-                quantity=formatted_quantity,
-                stopPrice=formatted_stop_price,
-                reduceOnly=reduce_only
-            )
-            orders['stop_loss'] = stop_order
-            self.logger.info(f"Stop-loss order placed: {stop_order.get('orderId')}")
+            # Place stop-loss and take-profit orders concurrently
+            results = self._run_async(self._place_oco_legs_async(
+                symbol,
+                exit_side,
+                formatted_quantity,
+                formatted_stop_price,
+                formatted_limit_price,
+                reduce_only
+            ))
             
-            # Place take-profit order
-            take_profit_order = self.client.futures_create_order(
-                symbol=symbol,
-                side='SELL' if side.upper() == 'BUY' else 'BUY',  # Opposite side for take-profit
-                type='TAKE_PROFIT_MARKET',
-                quantity=formatted_quantity,
-                stopPrice=formatted_limit_price,
-                reduceOnly=reduce_only
-            )
-            orders['take_profit'] = take_profit_order
-            self.logger.info(f"Take-profit order placed: {take_profit_order.get('orderId')}")
+            failed = False
+            for (leg, label), result in zip((('stop_loss', 'Stop-loss'), ('take_profit', 'Take-profit')), results):
+                if isinstance(result, Exception):
+                    failed = True
+                    self.log_error(result, f"placing OCO {leg} order for {symbol}")
+                else:
+                    orders[leg] = result
+                    self.logger.info("%s order placed: %s", label, result.get('orderId'))
+            
+            # One leg failed: cancel the other so no unprotected order is left behind
+            if failed:
+                self._cancel_oco_orders(symbol, orders)
+                return None
             
             # Log response
             self.log_order_response(orders)
@@ -112,23 +119,79 @@ class OCOOrders(BasicBot):
         except BinanceAPIException as e:
             self.log_error(e, f"placing OCO order for {symbol}")
             # Try to cancel any partially placed orders
-            self._cancel_oco_orders(symbol, orders if 'orders' in locals() else {})
+            self._cancel_oco_orders(symbol, orders)
             return None
         except BinanceOrderException as e:
             self.log_error(e, f"placing OCO order for {symbol}")
-            self._cancel_oco_orders(symbol, orders if 'orders' in locals() else {})
+            self._cancel_oco_orders(symbol, orders)
             return None
         except Exception as e:
             self.log_error(e, f"placing OCO order for {symbol}")
-            self._cancel_oco_orders(symbol, orders if 'orders' in locals() else {})
+            self._cancel_oco_orders(symbol, orders)
             return None
     
+    async def _place_oco_legs_async(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        stop_price: float,
+        take_profit_price: float,
+        reduce_only: bool
+    ) -> List[Any]:
+        """
+        Place both OCO legs concurrently
+        
+        Returns:
+            [stop-loss result, take-profit result], where a result is the
+            order response or the exception raised while placing it
+        """
+        client = await self._get_async_client()
+        return await asyncio.gather(
+            client.futures_create_order(
+                symbol=symbol,
+                side=side,
+                type='STOP_MARKET',
+                quantity=quantity,
+                stopPrice=stop_price,
+                reduceOnly=reduce_only
+            ),
+            client.futures_create_order(
+                symbol=symbol,
+                side=side,
+                type='TAKE_PROFIT_MARKET',
+                quantity=quantity,
+                stopPrice=take_profit_price,
+                reduceOnly=reduce_only
+            ),
+            return_exceptions=True
+        )
+    
     def _cancel_oco_orders(self, symbol: str, orders: Dict[str, Any]):
         """Cancel orders if OCO placement partially failed"""
-        for order_type, order in orders.items():
-            try:
-                if order and 'orderId' in order:
-                    self.client.futures_cancel_order(symbol=symbol, orderId=order['orderId'])
-                    self.logger.info(f"Cancelled {order_type} order: {order['orderId']}")
-            except Exception as e:
-                self.logger.error(f"Failed to cancel {order_type} order: {e}")
+        placed = [(order_type, order) for order_type, order in orders.items() if order and 'orderId' in order]
+        if not placed:
+            return
+        
+        try:
+            self._run_async(self._cancel_oco_orders_async(symbol, placed))
+        except Exception as e:
+            self.logger.error("Failed to cancel OCO orders: %s", e)
+    
+    async def _cancel_oco_orders_async(self, symbol: str, placed: List[Tuple[str, Dict[str, Any]]]):
+        """Cancel placed OCO orders concurrently, so no leg waits on another's cancel"""
+        try:
+            client = await self._get_async_client()
+        except Exception as e:
+            self.logger.error("Failed to cancel OCO orders: %s", e)
+            return
+        
+        results = await asyncio.gather(
+            *(client.futures_cancel_order(symbol=symbol, orderId=order['orderId']) for _, order in placed),
+            return_exceptions=True
+        )
+        for (order_type, order), result in zip(placed, results):
+            if isinstance(result, Exception):
+                self.logger.error("Failed to cancel %s order: %s", order_type, result)
+            else:
+                self.logger.info("Cancelled %s order: %s", order_type, order['orderId'])
@@ -9,6 +9,8 @@ from ..basic_bot import BasicBot
 class StopLimitOrders(BasicBot):
     """Handle stop-limit orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_stop_limit_order(
         self,
         symbol: str,
@@ -37,7 +39,8 @@ class StopLimitOrders(BasicBot):
             self.logger.error(f"Invalid symbol: {symbol}")
             return None
         
-        if side.upper() not in ['BUY', 'SELL']:
+        side = side.upper()
+        if side not in ['BUY', 'SELL']:
             self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
             return None
         
@@ -66,7 +69,7 @@ class StopLimitOrders(BasicBot):
         self.log_order_request(
             "STOP_LIMIT",
             symbol,
-            side.upper(),
+            side,
             quantity=formatted_quantity,
             stop_price=formatted_stop_price,
             limit_price=formatted_limit_price,
@@ -77,7 +80,7 @@ class StopLimitOrders(BasicBot):
             # Place stop-limit order
             order = self.client.futures_create_order(
                 symbol=symbol,
-                side=side.upper(),
+                side=side,
                 type='STOP',
                 quantity=formatted_quantity,
                 stopPrice=formatted_stop_price,
@@ -1,15 +1,19 @@
 """
 TWAP (Time-Weighted Average Price) - Split large orders into smaller chunks over time
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List
 from binance.exceptions import BinanceAPIException, BinanceOrderException
+import asyncio
 import time
 from ..basic_bot import BasicBot
+from ._kernels import twap_schedule_kernel
 
 
 class TWAPOrders(BasicBot):
     """Handle TWAP orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_twap_order(
         self,
         symbol: str,
@@ -38,7 +42,8 @@ class TWAPOrders(BasicBot):
             self.logger.error(f"Invalid symbol: {symbol}")
             return None
         
-        if side.upper() not in ['BUY', 'SELL']:
+        side = side.upper()
+        if side not in ['BUY', 'SELL']:
             self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
             return None
         
@@ -54,73 +59,46 @@ class TWAPOrders(BasicBot):
             self.logger.error(f"Invalid order_type: {order_type}")
             return None
         
-        # Calculate interval quantity and time
-        interval_quantity = total_quantity / num_intervals
-        interval_seconds = (duration_minutes * 60) / num_intervals
-        
-        # Format interval quantity
-        formatted_interval_quantity = self.format_quantity(symbol, interval_quantity)
-        if formatted_interval_quantity is None:
+        # Formatters are reused for every interval's limit price
+        formatters = self.make_formatter(symbol)
+        total_steps = self._quantity_to_steps(symbol, total_quantity)
+        if formatters is None or total_steps is None:
             self.logger.error(f"Failed to format quantity for {symbol}")
             return None
+        format_price = formatters[1]
+        
+        # Split the total in whole step sizes, so slices add up to the (step-rounded) total
+        slice_steps, interval_seconds = twap_schedule_kernel(total_steps, num_intervals, duration_minutes * 60)
+        interval_quantities = [self._format_steps(symbol, steps) for steps in slice_steps]
+        
+        # The last slice is the smallest; reject locally if it rounds below the minimum
+        if not self._meets_min_quantity(symbol, slice_steps[-1], interval_quantities[-1]):
+            return None
         
         # Log request
         self.log_order_request(
             "TWAP",
             symbol,
-            side.upper(),
+            side,
             total_quantity=total_quantity,
             duration_minutes=duration_minutes,
             num_intervals=num_intervals,
-            interval_quantity=formatted_interval_quantity,
+            interval_quantities=interval_quantities,
             interval_seconds=interval_seconds
         )
         
         orders = []
         
         try:
-            for i in range(num_intervals):
-                self.logger.info(f"TWAP: Placing order {i+1}/{num_intervals}")
-                
-                if order_type == 'MARKET':
-                    # Place market order
-                    order = self.client.futures_create_order(
-                        symbol=symbol,
-                        side=side.upper(),
-                        type='MARKET',
-                        quantity=formatted_interval_quantity
-                    )
-                else:
-                    # For limit orders, get current price
-                    ticker = self.client.futures_symbol_ticker(symbol=symbol)
-                    current_price = float(ticker['price'])
-                    
-                    # Adjust price slightly for better fill probability
-                    if side.upper() == 'BUY':
-                        limit_price = current_price * 0.999  # Slightly below market
-                    else:
-                        limit_price = current_price * 1.001  # Slightly above market
-                    
-                    formatted_price = self.format_price(symbol, limit_price)
-                    if formatted_price is None:
-                        self.logger.error(f"Failed to format price for {symbol}")
-                        continue
-                    
-                    order = self.client.futures_create_order(
-                        symbol=symbol,
-                        side=side.upper(),
-                        type='LIMIT',
-                        quantity=formatted_interval_quantity,
-                        price=formatted_price,
-                        timeInForce='IOC'  # Immediate or Cancel for better execution
-                    )
-                
-                orders.append(order)
-                self.logger.info(f"TWAP order {i+1} placed: {order.get('orderId')}")
-                
-                # Wait before next interval (except for last order)
-                if i < num_intervals - 1:
-                    time.sleep(interval_seconds)
+            self._run_async(self._run_twap_schedule(
+                symbol,
+                side,
+                interval_quantities,
+                interval_seconds,
+                order_type,
+                format_price,
+                orders
+            ))
             
             # Log response
             self.log_order_response({
@@ -139,3 +117,90 @@ class TWAPOrders(BasicBot):
         except Exception as e:
             self.log_error(e, f"placing TWAP order for {symbol}")
             return orders if orders else None
+    
+    async def _run_twap_schedule(
+        self,
+        symbol: str,
+        side: str,
+        interval_quantities: List[str],
+        interval_seconds: float,
+        order_type: str,
+        format_price: Callable[[float], str],
+        orders: List[Dict[str, Any]]
+    ):
+        """
+        Place one TWAP order per interval quantity on its schedule, appending each response to orders
+        
+        Orders are scheduled against absolute deadlines, and each order is
+        submitted as a task so its REST round-trip overlaps with the wait for
+        the next slot instead of adding to it. A failed order stops the
+        schedule; orders placed so far remain in orders.
+        """
+        client = await self._get_async_client()
+        place_interval = self._place_twap_interval
+        record_order = self._record_twap_order
+        start_time = time.monotonic()
+        pending = None
+        num_intervals = len(interval_quantities)
+        
+        for i, interval_quantity in enumerate(interval_quantities):
+            delay = start_time + i * interval_seconds - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif -delay > interval_seconds:
+                self.logger.warning("TWAP: %.2fs behind schedule, placing order %d immediately", -delay, i + 1)
+            
+            # Collect the previous order (its round-trip ran during the wait above)
+            if pending is not None:
+                record_order(await pending, i, orders)
+            
+            self.logger.info("TWAP: Placing order %d/%d", i + 1, num_intervals)
+            pending = asyncio.create_task(
+                place_interval(client, symbol, side, interval_quantity, order_type, format_price)
+            )
+        
+        if pending is not None:
+            record_order(await pending, num_intervals, orders)
+    
+    async def _place_twap_interval(
+        self,
+        client,
+        symbol: str,
+        side: str,
+        quantity: str,
+        order_type: str,
+        format_price: Callable[[float], str]
+    ) -> Dict[str, Any]:
+        """Place a single TWAP interval order"""
+        if order_type == 'MARKET':
+            # Place market order
+            return await client.futures_create_order(
+                symbol=symbol,
+                side=side,
+                type='MARKET',
+                quantity=quantity
+            )
+        
+        # For limit orders, get current price
+        ticker = await client.futures_symbol_ticker(symbol=symbol)
+        current_price = float(ticker['price'])
+        
+        # Adjust price slightly for better fill probability
+        if side == 'BUY':
+            limit_price = current_price * 0.999  # Slightly below market
+        else:
+            limit_price = current_price * 1.001  # Slightly above market
+        
+        return await client.futures_create_order(
+            symbol=symbol,
+            side=side,
+            type='LIMIT',
+            quantity=quantity,
+            price=format_price(limit_price),
+            timeInForce='IOC'  # Immediate or Cancel for better execution
+        )
+    
+    def _record_twap_order(self, order: Dict[str, Any], number: int, orders: List[Dict[str, Any]]):
+        """Record a placed TWAP order"""
+        orders.append(order)
+        self.logger.info("TWAP order %d placed: %s", number, order.get('orderId'))
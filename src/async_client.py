@@ -0,0 +1,132 @@
+"""
+Async Client - Shared aiohttp session and concurrent order submission
+"""
+import asyncio
+import threading
+import aiohttp
+from binance.client import AsyncClient
+from typing import Optional, Dict, Any, List, Tuple
+from .signing import get_signer
+
+
+# Connections in the shared session's pool, and the default number of requests in flight
+MAX_CONNECTIONS = 20
+
+# One event loop per process, run forever on its own thread, so async sessions can
+# be shared by every bot whichever thread (or running loop) calls into them
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+_shared_async_clients: Dict[Tuple[str, str, bool], AsyncClient] = {}
+# Created on the loop thread, so concurrent first calls don't each open a session
+_clients_lock: Optional[asyncio.Lock] = None
+
+
+async def get_shared_async_client(api_key: str, api_secret: str, testnet: bool = True) -> AsyncClient:
+    """
+    Get an AsyncClient shared by every bot with the same credentials
+    
+    The client is created on first use with a single aiohttp session
+    (pooled to MAX_CONNECTIONS connections) and lives on the process-wide
+    event loop until close_shared_clients() is called.
+    """
+    global _clients_lock
+    if _clients_lock is None:
+        _clients_lock = asyncio.Lock()
+    
+    key = (api_key, api_secret, testnet)
+    async with _clients_lock:
+        client = _shared_async_clients.get(key)
+        if client is None:
+            client = await AsyncClient.create(
+                api_key=api_key,
+                api_secret=api_secret,
+                testnet=testnet,
+                session_params={'connector': aiohttp.TCPConnector(limit=MAX_CONNECTIONS)}
+            )
+            # Sign from the pre-keyed HMAC template for this secret instead of re-keying per request
+            client._hmac_signature = get_signer(api_secret)
+            _shared_async_clients[key] = client
+    return client
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide event loop, starting its thread on first use"""
+    global _event_loop, _loop_thread
+    with _loop_lock:
+        if _event_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='binance-bot-loop', daemon=True)
+            thread.start()
+            _event_loop, _loop_thread = loop, thread
+        return _event_loop
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on the process-wide event loop
+    
+    The loop runs on its own thread; the calling thread blocks until the
+    coroutine finishes, as a blocking REST call would. Any number of threads
+    (and callers inside a running event loop, e.g. Jupyter) can use it at once.
+    """
+    try:
+        loop = _get_event_loop()
+        if threading.current_thread() is _loop_thread:
+            raise RuntimeError("run_async() cannot be called from a coroutine on the shared event loop")
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+    except BaseException:
+        # Never scheduled: close it so no "never awaited" coroutine is left behind
+        coro.close()
+        raise
+    
+    try:
+        return future.result()
+    except BaseException:
+        # e.g. KeyboardInterrupt while waiting: don't leave the coroutine running
+        future.cancel()
+        raise
+
+
+def close_shared_clients():
+    """Close every shared async session and stop the process-wide event loop"""
+    global _event_loop, _loop_thread, _clients_lock
+    if _event_loop is None:
+        return
+    for client in list(_shared_async_clients.values()):
+        run_async(client.close_connection())
+    _shared_async_clients.clear()
+    
+    with _loop_lock:
+        loop, thread = _event_loop, _loop_thread
+        _event_loop = _loop_thread = _clients_lock = None
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+async def place_many(
+    client: AsyncClient,
+    payloads: List[Dict[str, Any]],
+    max_in_flight: int = MAX_CONNECTIONS
+) -> List[Any]:
+    """
+    Place orders concurrently over one client's session
+    
+    Args:
+        client: Shared AsyncClient (see get_shared_async_client)
+        payloads: List of futures_create_order keyword arguments
+        max_in_flight: Maximum number of requests in flight at once (default: MAX_CONNECTIONS)
+    
+    Returns:
+        One entry per payload, in order: the order response, or the
+        exception raised while placing that order
+    """
+    futures_create_order = client.futures_create_order
+    semaphore = asyncio.Semaphore(max_in_flight)
+    
+    async def create_order(payload: Dict[str, Any]):
+        async with semaphore:
+            return await futures_create_order(**payload)
+    
+    return await asyncio.gather(*(create_order(p) for p in payloads), return_exceptions=True)
@@ -1,18 +1,118 @@
 """
 Basic Bot - Core trading bot class with Binance Futures API integration
 """
+import asyncio
+from decimal import Decimal, ROUND_CEILING
+from functools import lru_cache
+from itertools import islice
+import json
 import logging
-from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceOrderException
-from typing import Optional, Dict, Any
+import math
+import os
+import tempfile
+from binance.client import Client, AsyncClient
+from binance.exceptions import BinanceAPIException
+from typing import Optional, Dict, Any, Callable, FrozenSet, List, Sequence, Tuple
 import time
-import requests
+from .async_client import MAX_CONNECTIONS, close_shared_clients, get_shared_async_client, place_many, run_async
+from .signing import get_signer
+
+
+@lru_cache(maxsize=4)
+def get_shared_client(api_key: str, api_secret: str, testnet: bool = True) -> Client:
+    """Get a Client shared by every bot with the same credentials (one keep-alive session)"""
+    # python-binance routes futures calls to FUTURES_TESTNET_URL when testnet=True
+    client = Client(api_key=api_key, api_secret=api_secret, testnet=testnet)
+    # Sign from the pre-keyed HMAC template for this secret instead of re-keying per request
+    client._hmac_signature = get_signer(api_secret)
+    return client
+
+
+def _batch_order_value(value: Any) -> str:
+    """Encode an order parameter as a batchOrders string value (bools as 'true'/'false')"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    raise TypeError(f"Unsupported batch order value: {value!r}")
+
+
+# (tick exponent, tick units, step exponent, step units, min quantity units, min notional units):
+# sizes are integers scaled by 10**exponent, min notional by 10**(step exponent + tick exponent)
+SymbolFilters = Tuple[int, int, int, int, int, int]
+
+
+def _scale_size(size: Decimal) -> Tuple[int, int]:
+    """Split a filter size into (decimal exponent, size scaled by 10**exponent)"""
+    exponent = max(-size.normalize().as_tuple().exponent, 0)
+    return exponent, int(size.scaleb(exponent))
+
+
+def _scale_up(value: Decimal, exponent: int) -> int:
+    """Scale value by 10**exponent, rounding up to an integer"""
+    return int(value.scaleb(exponent).to_integral_value(ROUND_CEILING))
+
+
+# Relative distance from a unit boundary that is treated as float noise, not a real fraction
+_FLOAT_NOISE = 1e-15
+
+
+def _floor_units(value: float, exponent: int, step_units: int) -> int:
+    """Round value down to a multiple of step, in units of 10**-exponent"""
+    # Values within float noise of a unit are snapped to it, so 0.29 * 100 and
+    # 0.009 / 3 * 1000 give 29 and 3 rather than 28 and 2; everything else is floored
+    scaled = value * 10 ** exponent
+    units = round(scaled)
+    if abs(scaled - units) > abs(scaled) * _FLOAT_NOISE:
+        units = math.floor(scaled)
+    return units - units % step_units
+
+
+def _round_units(value: float, exponent: int, tick_units: int) -> int:
+    """Round value to the nearest multiple of tick, in units of 10**-exponent"""
+    return math.floor(value * 10 ** exponent / tick_units + 0.5) * tick_units
+
+
+def _format_units(units: int, exponent: int) -> str:
+    """Format an integer scaled by 10**exponent as a plain decimal string"""
+    if not exponent:
+        return str(units)
+    scale = 10 ** exponent
+    return f"{units // scale}.{units % scale:0{exponent}d}"
 
 
 class BasicBot:
     """Base class for Binance Futures trading bot"""
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, recv_window: int = 5000):
+    # Fixed attribute layout: no per-instance __dict__ (subclasses declare empty __slots__)
+    __slots__ = (
+        'api_key',
+        'api_secret',
+        'testnet',
+        'recv_window',
+        'client',
+        'logger',
+        '_symbol_info_cache',
+        '_precision_cache',
+        '_active_symbols',
+        '_symbol_filters',
+        '_exchange_info_loaded_at',
+    )
+    
+    # Seconds before cached exchange info is refetched (picks up listing changes)
+    EXCHANGE_INFO_TTL = 3600
+    
+    # Exchange info is also persisted here so fresh processes skip the REST call
+    EXCHANGE_INFO_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'binance-bot')
+    
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        testnet: bool = True,
+        recv_window: int = 5000,
+        client: Optional[Client] = None
+    ):
         """
         Initialize the trading bot
         
@@ -21,28 +121,25 @@ class BasicBot:
             api_secret: Binance API secret
             testnet: Whether to use testnet (default: True)
             recv_window: Receive window in milliseconds (default: 5000)
+            client: Existing Client to use (default: the client shared by all bots with these credentials)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
         self.recv_window = recv_window
         
-        # Configure Binance client with recvWindow
-        if testnet:
-            # For testnet, we need to use the testnet base URL
-            # Note: python-binance testnet=True should handle this, but we verify
-            self.client = Client(
-                api_key=api_key,
-                api_secret=api_secret,
-                testnet=True
-            )
-            # Explicitly set testnet base URL for futures
-            # This ensures we're using the correct testnet endpoint
-            if hasattr(self.client, 'FUTURES_URL'):
-                # python-binance should set this automatically, but we verify
-                pass
-        else:
-            self.client = Client(api_key=api_key, api_secret=api_secret)
+        # Symbol info keyed by symbol, fetched once from exchange info
+        self._symbol_info_cache: Dict[str, Dict[str, Any]] = {}
+        # (quantity precision, price precision) keyed by symbol, built alongside the symbol info
+        self._precision_cache: Dict[str, Tuple[int, int]] = {}
+        # Symbols currently trading, for validate_symbol
+        self._active_symbols: FrozenSet[str] = frozenset()
+        # Integer-scaled filters (see SymbolFilters) keyed by symbol, parsed on first use
+        self._symbol_filters: Dict[str, SymbolFilters] = {}
+        self._exchange_info_loaded_at: Optional[float] = None
+        
+        # Configure Binance client with recvWindow (strategies share one session by default)
+        self.client = client if client is not None else get_shared_client(api_key, api_secret, testnet)
         
         # Set recvWindow for all requests (increases tolerance for time differences)
         self.client.recv_window = recv_window
@@ -76,14 +173,8 @@ class BasicBot:
     def _sync_server_time(self):
         """Sync local time with Binance server time"""
         try:
-            if self.testnet:
-                base_url = 'https://testnet.binancefuture.com'
-            else:
-                base_url = 'https://fapi.binance.com'
-            
-            # Get server time
-            response = requests.get(f'{base_url}/fapi/v1/time', timeout=5)
-            server_time = response.json()['serverTime']
+            # Get server time over the client's already-open session
+            server_time = self.client.futures_time()['serverTime']
             
             # Calculate time difference
             local_time = int(time.time() * 1000)
@@ -99,12 +190,105 @@ class BasicBot:
             self.logger.warning(f"Could not sync server time: {e}")
             self.logger.warning("Continuing anyway, but timestamp errors may occur")
     
+    def _sign(self, query_string: str) -> str:
+        """Sign a request query string with the API secret (HMAC-SHA256, hex)"""
+        return get_signer(self.api_secret)(query_string)
+    
+    def _run_async(self, coro):
+        """Run a coroutine on the shared event loop"""
+        return run_async(coro)
+    
+    async def _get_async_client(self) -> AsyncClient:
+        """Get the async client shared by all bots with these credentials"""
+        return await get_shared_async_client(self.api_key, self.api_secret, self.testnet)
+    
+    async def _create_orders_concurrently(
+        self,
+        payloads: List[Dict[str, Any]],
+        max_in_flight: int = MAX_CONNECTIONS
+    ) -> List[Any]:
+        """
+        Submit orders concurrently over the shared async session (see async_client.place_many)
+        
+        Args:
+            payloads: List of futures_create_order keyword arguments
+            max_in_flight: Maximum number of requests in flight at once (default: MAX_CONNECTIONS)
+        
+        Returns:
+            One entry per payload, in order: the order response, or the
+            exception raised while placing that order
+        """
+        return await place_many(await self._get_async_client(), payloads, max_in_flight)
+    
+    async def _create_orders_batched(
+        self,
+        payloads: List[Dict[str, Any]],
+        batch_size: int = 5,
+        max_in_flight: int = MAX_CONNECTIONS
+    ) -> List[Any]:
+        """
+        Submit orders through the batchOrders endpoint, batch_size orders per request
+        
+        Orders rejected inside a batch response are retried once as single
+        orders. A batch request that fails as a whole is not retried (it may
+        still have reached the exchange); its error is reported for each of
+        its orders.
+        
+        Args:
+            payloads: List of futures_create_order keyword arguments
+            batch_size: Orders per batch request (Binance allows at most 5)
+            max_in_flight: Maximum number of batch requests in flight at once (default: MAX_CONNECTIONS)
+        
+        Returns:
+            One entry per payload, in order: the order response, or the
+            exception raised while placing that order
+        """
+        client = await self._get_async_client()
+        futures_place_batch_order = client.futures_place_batch_order
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        payload_iter = iter(payloads)
+        batches = list(iter(lambda: list(islice(payload_iter, batch_size)), []))
+        
+        async def place_batch(batch: List[Dict[str, Any]]):
+            async with semaphore:
+                # batchOrders entries are JSON objects with string values
+                return await futures_place_batch_order(
+                    batchOrders=[{key: _batch_order_value(value) for key, value in payload.items()} for payload in batch]
+                )
+        
+        responses = await asyncio.gather(*(place_batch(batch) for batch in batches), return_exceptions=True)
+        
+        results: List[Any] = []
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                results.extend([response] * len(batch))
+            else:
+                results.extend(response)
+        
+        # Per-order rejections come back as {'code': ..., 'msg': ...} entries
+        rejected = [i for i, result in enumerate(results) if isinstance(result, dict) and 'orderId' not in result]
+        if rejected:
+            retried = await self._create_orders_concurrently([payloads[i] for i in rejected], max_in_flight)
+            for i, result in zip(rejected, retried):
+                results[i] = result
+        
+        return results
+    
+    def close(self):
+        """Close the shared async sessions and event loop (call once, when all bots are done)"""
+        close_shared_clients()
+    
     def validate_symbol(self, symbol: str) -> bool:
-        """Validate trading symbol format"""
+        """Validate that the symbol is listed on Binance Futures"""
         if not symbol or not isinstance(symbol, str):
             return False
-        # Basic validation: should be uppercase and contain USDT
-        return symbol.isupper() and 'USDT' in symbol
+        try:
+            self._ensure_exchange_info()
+        except Exception as e:
+            self.logger.error(f"Error fetching symbol info: {e}")
+            return False
+        return symbol in self._active_symbols
     
     def validate_quantity(self, quantity: float) -> bool:
         """Validate order quantity"""
@@ -114,44 +298,294 @@ class BasicBot:
         """Validate order price"""
         return price > 0
     
+    def validate_prices_bulk(self, prices: Sequence[float]) -> List[bool]:
+        """
+        Validate a batch of prices in one pass
+        
+        Args:
+            prices: Prices to validate
+        
+        Returns:
+            Mask with True for each price that is positive and finite
+        """
+        isfinite = math.isfinite
+        return [price > 0 and isfinite(price) for price in prices]
+    
+    def _load_exchange_info(self) -> Tuple[List[Dict[str, Any]], float]:
+        """
+        Load the futures symbols list, from the disk cache if fresh or via REST
+        
+        Returns:
+            Tuple of (symbols list, age of the data in seconds)
+        """
+        filename = 'exchange_info_testnet.json' if self.testnet else 'exchange_info.json'
+        path = os.path.join(self.EXCHANGE_INFO_CACHE_DIR, filename)
+        
+        # A missing or corrupted cache must never block trading, so fall back to REST
+        try:
+            age = time.time() - os.path.getmtime(path)
+            if age < self.EXCHANGE_INFO_TTL:
+                with open(path, 'r') as f:
+                    symbols = json.load(f)
+                if isinstance(symbols, list):
+                    return symbols, age
+        except (OSError, ValueError):
+            pass
+        
+        symbols = self.client.futures_exchange_info()['symbols']
+        
+        # Write atomically, through a temp file unique to this writer, so concurrent
+        # processes never interleave writes and readers never see a partial file
+        tmp_path = None
+        try:
+            os.makedirs(self.EXCHANGE_INFO_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.EXCHANGE_INFO_CACHE_DIR, prefix=filename, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(symbols, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Could not write exchange info cache: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        return symbols, 0.0
+    
+    def _ensure_exchange_info(self) -> Dict[str, Dict[str, Any]]:
+        """Get symbol info keyed by symbol, (re)loading it when missing or expired"""
+        loaded_at = self._exchange_info_loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.EXCHANGE_INFO_TTL:
+            symbols, age = self._load_exchange_info()
+            self._symbol_info_cache = {s['symbol']: s for s in symbols}
+            self._precision_cache = {
+                s['symbol']: (s.get('quantityPrecision', 8), s.get('pricePrecision', 8)) for s in symbols
+            }
+            self._active_symbols = frozenset(s['symbol'] for s in symbols if s.get('status', 'TRADING') == 'TRADING')
+            self._symbol_filters = {}
+            self._exchange_info_loaded_at = time.monotonic() - age
+        return self._symbol_info_cache
+    
     def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Get symbol trading information"""
+        """Get symbol trading information (served from the exchange info cache)"""
         try:
-            exchange_info = self.client.futures_exchange_info()
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    return s
+            return self._ensure_exchange_info().get(symbol)
+        except Exception as e:
+            self.logger.error(f"Error fetching symbol info: {e}")
             return None
+    
+    def get_precision(self, symbol: str) -> Optional[Tuple[int, int]]:
+        """Get (quantity precision, price precision) for a symbol"""
+        try:
+            self._ensure_exchange_info()
         except Exception as e:
             self.logger.error(f"Error fetching symbol info: {e}")
             return None
+        return self._precision_cache.get(symbol)
     
-    def format_quantity(self, symbol: str, quantity: float) -> Optional[float]:
-        """Format quantity according to symbol precision"""
+    def _load_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """Parse and cache a symbol's exchange filters (see get_symbol_filters)"""
         symbol_info = self.get_symbol_info(symbol)
         if not symbol_info:
             return None
         
-        quantity_precision = symbol_info.get('quantityPrecision', 8)
-        return round(quantity, quantity_precision)
+        filters = {f.get('filterType'): f for f in symbol_info.get('filters', [])}
+        price_filter = filters.get('PRICE_FILTER', {})
+        lot_size = filters.get('LOT_SIZE', {})
+        min_notional = filters.get('MIN_NOTIONAL', {})
+        
+        # Fall back to the published precision when a filter is missing or zero
+        tick_size = Decimal(price_filter.get('tickSize', '0')) or Decimal(1).scaleb(-symbol_info.get('pricePrecision', 8))
+        step_size = Decimal(lot_size.get('stepSize', '0')) or Decimal(1).scaleb(-symbol_info.get('quantityPrecision', 8))
+        
+        # Decimal is only used here; formatting and checks work on the scaled integers
+        tick_exp, tick_units = _scale_size(tick_size)
+        step_exp, step_units = _scale_size(step_size)
+        symbol_filters = (
+            tick_exp,
+            tick_units,
+            step_exp,
+            step_units,
+            _scale_up(Decimal(lot_size.get('minQty', '0')), step_exp),
+            _scale_up(Decimal(min_notional.get('notional', '0')), step_exp + tick_exp)
+        )
+        self._symbol_filters[symbol] = symbol_filters
+        return symbol_filters
     
-    def format_price(self, symbol: str, price: float) -> Optional[float]:
-        """Format price according to symbol precision"""
-        symbol_info = self.get_symbol_info(symbol)
-        if not symbol_info:
+    def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """Get a symbol's tick size, step size, min quantity and min notional as scaled integers"""
+        return self._symbol_filters.get(symbol) or self._load_symbol_filters(symbol)
+    
+    def _quantity_to_steps(self, symbol: str, quantity: float) -> Optional[int]:
+        """Get the number of whole step sizes in quantity, or None if symbol filters are unavailable"""
+        symbol_filters = self.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            return None
+        step_exp, step_units = symbol_filters[2], symbol_filters[3]
+        return _floor_units(quantity, step_exp, step_units) // step_units
+    
+    def _format_steps(self, symbol: str, steps: int) -> str:
+        """Format a whole number of step sizes as a quantity string (filters must be loaded)"""
+        symbol_filters = self._symbol_filters[symbol]
+        return _format_units(steps * symbol_filters[3], symbol_filters[2])
+    
+    def _meets_min_quantity(self, symbol: str, steps: int, quantity: Any) -> bool:
+        """
+        Check that a quantity of steps step sizes is non-zero and at least the
+        symbol's minimum quantity, logging the rejection (filters must be loaded)
+        """
+        step_exp, step_units, min_qty_units = self._symbol_filters[symbol][2:5]
+        if steps <= 0 or steps * step_units < min_qty_units:
+            min_qty = _format_units(min_qty_units, step_exp)
+            self.logger.error(f"Quantity {quantity} is below the minimum {min_qty} for {symbol}")
+            return False
+        return True
+    
+    def format_quantity(self, symbol: str, quantity: float) -> Optional[str]:
+        """Format quantity by rounding down to the symbol's step size"""
+        symbol_filters = self.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            return None
+        step_exp, step_units = symbol_filters[2], symbol_filters[3]
+        return _format_units(_floor_units(quantity, step_exp, step_units), step_exp)
+    
+    def format_price(self, symbol: str, price: float) -> Optional[str]:
+        """Format price by rounding to the symbol's tick size"""
+        symbol_filters = self.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            return None
+        tick_exp, tick_units = symbol_filters[0], symbol_filters[1]
+        return _format_units(_round_units(price, tick_exp, tick_units), tick_exp)
+    
+    def _validate_and_format(
+        self,
+        symbol: str,
+        quantity: float,
+        price: Optional[float] = None,
+        reduce_only: bool = False
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Validate an order's symbol, quantity and price, and format them
+        
+        Formatting and the minimum quantity/notional checks use the cached
+        symbol filters, so repeated orders on a symbol cost no API calls.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            quantity: Order quantity
+            price: Order price, or None for market orders
+            reduce_only: Reduce-only order (exempt from the minimum notional)
+        
+        Returns:
+            Tuple of (formatted quantity, formatted price or None), or None if
+            validation failed (the reason is logged)
+        """
+        if not self.validate_symbol(symbol):
+            self.logger.error(f"Invalid symbol: {symbol}")
+            return None
+        
+        if not self.validate_quantity(quantity):
+            self.logger.error(f"Invalid quantity: {quantity}")
             return None
         
-        price_precision = symbol_info.get('pricePrecision', 8)
-        return round(price, price_precision)
+        if price is not None and not self.validate_price(price):
+            self.logger.error(f"Invalid price: {price}")
+            return None
+        
+        symbol_filters = self.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            self.logger.error(f"Failed to format quantity/price for {symbol}")
+            return None
+        tick_exp, tick_units, step_exp, step_units, min_qty_units, min_notional_units = symbol_filters
+        
+        quantity_units = _floor_units(quantity, step_exp, step_units)
+        if not self._meets_min_quantity(symbol, quantity_units // step_units, quantity):
+            return None
+        formatted_quantity = _format_units(quantity_units, step_exp)
+        
+        if price is None:
+            return formatted_quantity, None
+        
+        price_units = _round_units(price, tick_exp, tick_units)
+        if not reduce_only and quantity_units * price_units < min_notional_units:
+            min_notional = _format_units(min_notional_units, step_exp + tick_exp)
+            self.logger.error(f"Order value is below the minimum notional {min_notional} for {symbol}")
+            return None
+        
+        return formatted_quantity, _format_units(price_units, tick_exp)
+    
+    def _preflight(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: Optional[float] = None,
+        tif: Optional[str] = None,
+        reduce_only: bool = False
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Validate and format a simple order before it is placed
+        
+        Checks the side and, when given, the time in force, then validates
+        and formats symbol/quantity/price (see _validate_and_format).
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            price: Order price, or None for market orders
+            tif: Time in force ('GTC', 'IOC' or 'FOK'), or None if not applicable
+            reduce_only: Reduce-only order (exempt from the minimum notional)
+        
+        Returns:
+            Tuple of (formatted quantity, formatted price or None), or None if
+            validation failed (the reason is logged)
+        """
+        if side.upper() not in ('BUY', 'SELL'):
+            self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
+            return None
+        
+        if tif is not None and tif not in ('GTC', 'IOC', 'FOK'):
+            self.logger.error(f"Invalid time_in_force: {tif}")
+            return None
+        
+        return self._validate_and_format(symbol, quantity, price, reduce_only)
+    
+    def make_formatter(self, symbol: str) -> Optional[Tuple[Callable[[float], str], Callable[[float], str]]]:
+        """
+        Build quantity and price formatters specialized for one symbol
+        
+        Step and tick size are looked up once and captured by the returned
+        closures, so loops that format many values for the same symbol skip
+        the per-call filter lookup done by format_quantity/format_price.
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+        
+        Returns:
+            Tuple of (format_quantity, format_price) callables, or None if
+            symbol info is unavailable
+        """
+        symbol_filters = self.get_symbol_filters(symbol)
+        if symbol_filters is None:
+            return None
+        
+        tick_exp, tick_units, step_exp, step_units = symbol_filters[:4]
+        
+        def format_quantity(quantity: float) -> str:
+            return _format_units(_floor_units(quantity, step_exp, step_units), step_exp)
+        
+        def format_price(price: float) -> str:
+            return _format_units(_round_units(price, tick_exp, tick_units), tick_exp)
+        
+        return format_quantity, format_price
     
     def log_order_request(self, order_type: str, symbol: str, side: str, **kwargs):
         """Log order request details"""
-        self.logger.info(f"Order Request - Type: {order_type}, Symbol: {symbol}, Side: {side}, Details: {kwargs}")
+        self.logger.info("Order Request - Type: %s, Symbol: %s, Side: %s, Details: %s", order_type, symbol, side, kwargs)
     
     def log_order_response(self, response: Dict[str, Any]):
         """Log order response"""
-        self.logger.info(f"Order Response: {response}")
+        self.logger.info("Order Response: %s", response)
     
     def log_error(self, error: Exception, context: str = ""):
         """Log errors with context"""
-        self.logger.error(f"Error {context}: {type(error).__name__} - {str(error)}", exc_info=True)
+        self.logger.error("Error %s: %s - %s", context, type(error).__name__, error, exc_info=error)
@@ -1,68 +1,14 @@
 """
 CLI Interface for Binance Futures Trading Bot
 """
-import argparse
 import sys
 import os
-from dotenv import load_dotenv
 import logging
-from .trading_bot import TradingBot
-from .time_sync import print_time_sync_info
 
-# Load environment variables
-load_dotenv()
+# argparse, TradingBot (python-binance) and dotenv are imported only on the
+# paths that need them, so --help and argument errors stay fast
 
-
-def setup_logging():
-    """Setup logging configuration"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('bot.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-
-
-def print_order_result(order_result, order_type: str):
-    """Print order result in a formatted way"""
-    if order_result:
-        print(f"\n{'='*60}")
-        print(f"{order_type} Order Placed Successfully!")
-        print(f"{'='*60}")
-        if isinstance(order_result, dict):
-            if 'orderId' in order_result:
-                print(f"Order ID: {order_result['orderId']}")
-                print(f"Symbol: {order_result.get('symbol', 'N/A')}")
-                print(f"Side: {order_result.get('side', 'N/A')}")
-                print(f"Type: {order_result.get('type', 'N/A')}")
-                print(f"Quantity: {order_result.get('origQty', 'N/A')}")
-                print(f"Status: {order_result.get('status', 'N/A')}")
-            else:
-                # Handle OCO or Grid orders
-                for key, value in order_result.items():
-                    if isinstance(value, list):
-                        print(f"{key}: {len(value)} orders")
-                    else:
-                        print(f"{key}: {value}")
-        elif isinstance(order_result, list):
-            print(f"Total Orders: {len(order_result)}")
-            for i, order in enumerate(order_result, 1):
-                print(f"  Order {i}: ID {order.get('orderId', 'N/A')}")
-        print(f"{'='*60}\n")
-    else:
-        print(f"\n[ERROR] Failed to place {order_type} order. Check logs for details.\n")
-
-
-def main():
-    """Main CLI entry point"""
-    setup_logging()
-    
-    parser = argparse.ArgumentParser(
-        description='Binance Futures Trading Bot - CLI Interface',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Market order
   python -m src.cli market BUY BTCUSDT 0.01
@@ -79,90 +25,394 @@ Examples:
   # Grid order
   python -m src.cli grid BTCUSDT 48000 52000 10 0.01
         """
+
+# Fixed-width snapshot of the top-level help as argparse formats it at 80 columns on
+# Python 3.10+, so bare and -h/--help runs can skip importing argparse. Keep it in sync
+# with the global options and _SUBCOMMAND_BUILDERS; other widths/Pythons use argparse.
+_STATIC_HELP = """usage: %(prog)s [-h] [--api-key API_KEY] [--api-secret API_SECRET] [--mainnet]
+              {market,limit,stop-limit,oco,twap,grid,info,cancel,time-sync}
+              ...
+
+Binance Futures Trading Bot - CLI Interface
+
+positional arguments:
+  {market,limit,stop-limit,oco,twap,grid,info,cancel,time-sync}
+                        Order type
+    market              Place a market order
+    limit               Place a limit order
+    stop-limit          Place a stop-limit order
+    oco                 Place an OCO order (take-profit and stop-loss)
+    twap                Place a TWAP order
+    grid                Place grid orders
+    info                Get account information
+    cancel              Cancel an order
+    time-sync           Check time synchronization with Binance
+
+options:
+  -h, --help            show this help message and exit
+  --api-key API_KEY     Binance API key (or set BINANCE_API_KEY env var)
+  --api-secret API_SECRET
+                        Binance API secret (or set BINANCE_API_SECRET env var)
+  --mainnet             Use mainnet instead of testnet
+""" + _EPILOG
+
+
+# Set once .env has been loaded into os.environ
+_ENV_LOADED = False
+
+
+def _load_env_once():
+    """Load .env into os.environ, only on the first call"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+# Commands that place no orders, so they don't need to open bot.log
+_READ_ONLY_COMMANDS = frozenset({None, 'time-sync', 'info'})
+
+
+def setup_logging(command=None):
+    """Setup logging configuration (console only for read-only commands)"""
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if command not in _READ_ONLY_COMMANDS:
+        handlers.insert(0, logging.FileHandler('bot.log'))
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
     )
+
+
+def print_order_result(order_result, order_type: str):
+    """Print order result in a formatted way"""
+    if not order_result:
+        sys.stdout.write(f"\n[ERROR] Failed to place {order_type} order. Check logs for details.\n\n")
+        return
     
-    # Global arguments
-    parser.add_argument('--api-key', type=str, help='Binance API key (or set BINANCE_API_KEY env var)')
-    parser.add_argument('--api-secret', type=str, help='Binance API secret (or set BINANCE_API_SECRET env var)')
-    parser.add_argument('--mainnet', action='store_true', help='Use mainnet instead of testnet')
-    
-    subparsers = parser.add_subparsers(dest='command', help='Order type')
-    
-    # Market order
+    # Build the whole report, then write it to stdout in one call
+    rule = '=' * 60
+    parts = [f"\n{rule}", f"{order_type} Order Placed Successfully!", rule]
+    if isinstance(order_result, dict):
+        if 'orderId' in order_result:
+            get = order_result.get
+            parts += [
+                f"Order ID: {order_result['orderId']}",
+                f"Symbol: {get('symbol', 'N/A')}",
+                f"Side: {get('side', 'N/A')}",
+                f"Type: {get('type', 'N/A')}",
+                f"Quantity: {get('origQty', 'N/A')}",
+                f"Status: {get('status', 'N/A')}",
+            ]
+        else:
+            # Handle OCO or Grid orders
+            for key, value in order_result.items():
+                if isinstance(value, list):
+                    parts.append(f"{key}: {len(value)} orders")
+                else:
+                    parts.append(f"{key}: {value}")
+    elif isinstance(order_result, list):
+        parts.append(f"Total Orders: {len(order_result)}")
+        parts += [f"  Order {i}: ID {order.get('orderId', 'N/A')}" for i, order in enumerate(order_result, 1)]
+    parts.append(f"{rule}\n")
+    sys.stdout.write('\n'.join(parts) + '\n')
+
+
+# Argument choices, shared by every subparser that uses them
+_SIDES = ('BUY', 'SELL')
+_TIF = ('GTC', 'IOC', 'FOK')
+_ORDER_TYPES_TWAP = ('MARKET', 'LIMIT')
+_ORDER_TYPES_GRID = ('LIMIT', 'MARKET')
+
+
+def _add_market_parser(subparsers):
+    """Market order"""
     market_parser = subparsers.add_parser('market', help='Place a market order')
-    market_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
+    market_parser.add_argument('side', choices=_SIDES, help='Order side')
     market_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     market_parser.add_argument('quantity', type=float, help='Order quantity')
     market_parser.add_argument('--reduce-only', action='store_true', help='Reduce only order')
-    
-    # Limit order
+
+
+def _add_limit_parser(subparsers):
+    """Limit order"""
     limit_parser = subparsers.add_parser('limit', help='Place a limit order')
-    limit_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
+    limit_parser.add_argument('side', choices=_SIDES, help='Order side')
     limit_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     limit_parser.add_argument('quantity', type=float, help='Order quantity')
     limit_parser.add_argument('price', type=float, help='Limit price')
-    limit_parser.add_argument('--time-in-force', choices=['GTC', 'IOC', 'FOK'], default='GTC', help='Time in force')
+    limit_parser.add_argument('--time-in-force', choices=_TIF, default='GTC', help='Time in force')
     limit_parser.add_argument('--reduce-only', action='store_true', help='Reduce only order')
-    
-    # Stop-limit order
+
+
+def _add_stop_limit_parser(subparsers):
+    """Stop-limit order"""
     stop_limit_parser = subparsers.add_parser('stop-limit', help='Place a stop-limit order')
-    stop_limit_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
+    stop_limit_parser.add_argument('side', choices=_SIDES, help='Order side')
     stop_limit_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     stop_limit_parser.add_argument('quantity', type=float, help='Order quantity')
     stop_limit_parser.add_argument('stop_price', type=float, help='Stop price')
     stop_limit_parser.add_argument('limit_price', type=float, help='Limit price')
     stop_limit_parser.add_argument('--reduce-only', action='store_true', help='Reduce only order')
-    
-    # OCO order
+
+
+def _add_oco_parser(subparsers):
+    """OCO order"""
     oco_parser = subparsers.add_parser('oco', help='Place an OCO order (take-profit and stop-loss)')
-    oco_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
+    oco_parser.add_argument('side', choices=_SIDES, help='Order side')
     oco_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     oco_parser.add_argument('quantity', type=float, help='Order quantity')
     oco_parser.add_argument('price', type=float, help='Current market price')
     oco_parser.add_argument('stop_price', type=float, help='Stop-loss price')
     oco_parser.add_argument('limit_price', type=float, help='Take-profit limit price')
     oco_parser.add_argument('--reduce-only', action='store_true', help='Reduce only order')
-    
-    # TWAP order
+
+
+def _add_twap_parser(subparsers):
+    """TWAP order"""
     twap_parser = subparsers.add_parser('twap', help='Place a TWAP order')
-    twap_parser.add_argument('side', choices=['BUY', 'SELL'], help='Order side')
+    twap_parser.add_argument('side', choices=_SIDES, help='Order side')
     twap_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     twap_parser.add_argument('total_quantity', type=float, help='Total quantity to trade')
     twap_parser.add_argument('duration_minutes', type=int, help='Duration in minutes')
     twap_parser.add_argument('--intervals', type=int, default=10, help='Number of intervals (default: 10)')
-    twap_parser.add_argument('--order-type', choices=['MARKET', 'LIMIT'], default='MARKET', help='Order type')
-    
-    # Grid order
+    twap_parser.add_argument('--order-type', choices=_ORDER_TYPES_TWAP, default='MARKET', help='Order type')
+
+
+def _add_grid_parser(subparsers):
+    """Grid order"""
     grid_parser = subparsers.add_parser('grid', help='Place grid orders')
     grid_parser.add_argument('symbol', type=str, help='Trading symbol (e.g., BTCUSDT)')
     grid_parser.add_argument('lower_price', type=float, help='Lower price bound')
     grid_parser.add_argument('upper_price', type=float, help='Upper price bound')
     grid_parser.add_argument('grid_levels', type=int, help='Number of grid levels')
     grid_parser.add_argument('quantity_per_grid', type=float, help='Quantity per grid level')
-    grid_parser.add_argument('--order-type', choices=['LIMIT', 'MARKET'], default='LIMIT', help='Order type')
-    
-    # Account info
+    grid_parser.add_argument('--order-type', choices=_ORDER_TYPES_GRID, default='LIMIT', help='Order type')
+
+
+def _add_info_parser(subparsers):
+    """Account info"""
     info_parser = subparsers.add_parser('info', help='Get account information')
     info_parser.add_argument('--symbol', type=str, help='Get position for specific symbol')
-    
-    # Cancel order
+
+
+def _add_cancel_parser(subparsers):
+    """Cancel order"""
     cancel_parser = subparsers.add_parser('cancel', help='Cancel an order')
     cancel_parser.add_argument('symbol', type=str, help='Trading symbol')
     cancel_parser.add_argument('--order-id', type=int, help='Order ID to cancel')
     cancel_parser.add_argument('--all', action='store_true', help='Cancel all open orders')
+
+
+def _add_time_sync_parser(subparsers):
+    """Time sync check"""
+    subparsers.add_parser('time-sync', help='Check time synchronization with Binance')
+
+
+# Subcommand name -> function registering its subparser (insertion order is the help order)
+_SUBCOMMAND_BUILDERS = {
+    'market': _add_market_parser,
+    'limit': _add_limit_parser,
+    'stop-limit': _add_stop_limit_parser,
+    'oco': _add_oco_parser,
+    'twap': _add_twap_parser,
+    'grid': _add_grid_parser,
+    'info': _add_info_parser,
+    'cancel': _add_cancel_parser,
+    'time-sync': _add_time_sync_parser,
+}
+
+# Global options that consume the following argv token
+_GLOBAL_OPTIONS_WITH_VALUE = ('--api-key', '--api-secret')
+
+
+def _sniff_subcommand(argv):
+    """
+    Find the subcommand in argv without building the parser
     
-    # Time sync check
-    sync_parser = subparsers.add_parser('time-sync', help='Check time synchronization with Binance')
+    Returns:
+        The subcommand name, or None for help requests, missing or unknown
+        commands (the full parser is needed to report those)
+    """
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in ('-h', '--help'):
+            return None
+        if arg in _GLOBAL_OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg if arg in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def _do_market(bot, args):
+    """Place a market order"""
+    if args.side == 'BUY':
+        result = bot.market_buy(args.symbol, args.quantity, args.reduce_only)
+    else:
+        result = bot.market_sell(args.symbol, args.quantity, args.reduce_only)
+    print_order_result(result, 'Market')
+
+
+def _do_limit(bot, args):
+    """Place a limit order"""
+    if args.side == 'BUY':
+        result = bot.limit_buy(args.symbol, args.quantity, args.price, args.time_in_force, args.reduce_only)
+    else:
+        result = bot.limit_sell(args.symbol, args.quantity, args.price, args.time_in_force, args.reduce_only)
+    print_order_result(result, 'Limit')
+
+
+def _do_stop_limit(bot, args):
+    """Place a stop-limit order"""
+    if args.side == 'BUY':
+        result = bot.stop_limit_buy(args.symbol, args.quantity, args.stop_price, args.limit_price, args.reduce_only)
+    else:
+        result = bot.stop_limit_sell(args.symbol, args.quantity, args.stop_price, args.limit_price, args.reduce_only)
+    print_order_result(result, 'Stop-Limit')
+
+
+def _do_oco(bot, args):
+    """Place an OCO order"""
+    result = bot.place_oco_order(
+        args.symbol, args.side, args.quantity, args.price,
+        args.stop_price, args.limit_price, args.reduce_only
+    )
+    print_order_result(result, 'OCO')
+
+
+def _do_twap(bot, args):
+    """Place a TWAP order"""
+    result = bot.place_twap_order(
+        args.symbol, args.side, args.total_quantity,
+        args.duration_minutes, args.intervals, args.order_type
+    )
+    print_order_result(result, 'TWAP')
+
+
+def _do_grid(bot, args):
+    """Place grid orders"""
+    result = bot.place_grid_orders(
+        args.symbol, args.lower_price, args.upper_price,
+        args.grid_levels, args.quantity_per_grid, args.order_type
+    )
+    print_order_result(result, 'Grid')
+
+
+def _do_info(bot, args):
+    """Print account balance and, optionally, a position"""
+    balance = bot.get_account_balance()
+    print(f"\n{'='*60}")
+    print("Account Information")
+    print(f"{'='*60}")
+    for key, value in balance.items():
+        print(f"{key.replace('_', ' ').title()}: {value}")
     
+    if args.symbol:
+        position = bot.get_position(args.symbol)
+        if position:
+            print(f"\nPosition for {args.symbol}:")
+            for key, value in position.items():
+                print(f"  {key.replace('_', ' ').title()}: {value}")
+    print(f"{'='*60}\n")
+
+
+def _do_cancel(bot, args):
+    """Cancel one order or all orders for a symbol"""
+    if args.all:
+        success = bot.cancel_all_orders(args.symbol)
+        status = "[OK]" if success else "[ERROR]"
+        print(f"{status} Cancel all orders: {'Success' if success else 'Failed'}")
+    elif args.order_id:
+        success = bot.cancel_order(args.symbol, args.order_id)
+        status = "[OK]" if success else "[ERROR]"
+        print(f"{status} Cancel order {args.order_id}: {'Success' if success else 'Failed'}")
+    else:
+        print("[ERROR] Specify --order-id or --all")
+
+
+# Handlers for commands that need a bot, keyed by subcommand name
+COMMANDS = {
+    'market': _do_market,
+    'limit': _do_limit,
+    'stop-limit': _do_stop_limit,
+    'oco': _do_oco,
+    'twap': _do_twap,
+    'grid': _do_grid,
+    'info': _do_info,
+    'cancel': _do_cancel,
+}
+
+
+def _build_parser(command=None):
+    """
+    Build the argument parser
+    
+    Args:
+        command: Only register this subcommand's parser (default: register all of them)
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description='Binance Futures Trading Bot - CLI Interface',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+    
+    # Global arguments
+    parser.add_argument('--api-key', type=str, help='Binance API key (or set BINANCE_API_KEY env var)')
+    parser.add_argument('--api-secret', type=str, help='Binance API secret (or set BINANCE_API_SECRET env var)')
+    parser.add_argument('--mainnet', action='store_true', help='Use mainnet instead of testnet')
+    
+    subparsers = parser.add_subparsers(dest='command', help='Order type')
+    
+    if command is not None:
+        _SUBCOMMAND_BUILDERS[command](subparsers)
+    else:
+        for add_subcommand in _SUBCOMMAND_BUILDERS.values():
+            add_subcommand(subparsers)
+    
+    return parser
+
+
+def _static_help_matches() -> bool:
+    """Whether argparse would print _STATIC_HELP verbatim here (same width and section titles)"""
+    import shutil
+    return sys.version_info >= (3, 10) and shutil.get_terminal_size().columns == 80
+
+
+def main():
+    """Main CLI entry point"""
+    # Bare invocation and plain help only print the top-level help
+    if len(sys.argv) == 1 or sys.argv[1:] in (['-h'], ['--help']):
+        if _static_help_matches():
+            print(_STATIC_HELP % {'prog': os.path.basename(sys.argv[0])})
+            return
+    
+    # Only build the subparser being invoked; help and unknown commands get all of them
+    parser = _build_parser(_sniff_subcommand(sys.argv))
     args = parser.parse_args()
+    setup_logging(args.command)
     
     if not args.command:
         parser.print_help()
         return
     
+    # Time sync check needs no credentials or bot
+    if args.command == 'time-sync':
+        from .time_sync import print_time_sync_info
+        print_time_sync_info()
+        return
+    
+    # Load environment variables (only commands that need credentials get here)
+    _load_env_once()
+    
     # Get API credentials
-    api_key = args.api_key or os.getenv('BINANCE_API_KEY')
-    api_secret = args.api_secret or os.getenv('BINANCE_API_SECRET')
+    api_key = args.api_key or os.environ.get('BINANCE_API_KEY')
+    api_secret = args.api_secret or os.environ.get('BINANCE_API_SECRET')
     
     if not api_key or not api_secret:
         print("[ERROR] API key and secret are required!")
@@ -170,6 +420,7 @@ Examples:
         sys.exit(1)
     
     # Initialize bot
+    from .trading_bot import TradingBot
     try:
         bot = TradingBot(api_key, api_secret, testnet=not args.mainnet)
     except Exception as e:
@@ -203,78 +454,7 @@ Examples:
     
     # Execute command
     try:
-        if args.command == 'market':
-            if args.side == 'BUY':
-                result = bot.market_buy(args.symbol, args.quantity, args.reduce_only)
-            else:
-                result = bot.market_sell(args.symbol, args.quantity, args.reduce_only)
-            print_order_result(result, 'Market')
-        
-        elif args.command == 'limit':
-            if args.side == 'BUY':
-                result = bot.limit_buy(args.symbol, args.quantity, args.price, args.time_in_force, args.reduce_only)
-            else:
-                result = bot.limit_sell(args.symbol, args.quantity, args.price, args.time_in_force, args.reduce_only)
-            print_order_result(result, 'Limit')
-        
-        elif args.command == 'stop-limit':
-            if args.side == 'BUY':
-                result = bot.stop_limit_buy(args.symbol, args.quantity, args.stop_price, args.limit_price, args.reduce_only)
-            else:
-                result = bot.stop_limit_sell(args.symbol, args.quantity, args.stop_price, args.limit_price, args.reduce_only)
-            print_order_result(result, 'Stop-Limit')
-        
-        elif args.command == 'oco':
-            result = bot.place_oco_order(
-                args.symbol, args.side, args.quantity, args.price,
-                args.stop_price, args.limit_price, args.reduce_only
-            )
-            print_order_result(result, 'OCO')
-        
-        elif args.command == 'twap':
-            result = bot.place_twap_order(
-                args.symbol, args.side, args.total_quantity,
-                args.duration_minutes, args.intervals, args.order_type
-            )
-            print_order_result(result, 'TWAP')
-        
-        elif args.command == 'grid':
-            result = bot.place_grid_orders(
-                args.symbol, args.lower_price, args.upper_price,
-                args.grid_levels, args.quantity_per_grid, args.order_type
-            )
-            print_order_result(result, 'Grid')
-        
-        elif args.command == 'info':
-            balance = bot.get_account_balance()
-            print(f"\n{'='*60}")
-            print("Account Information")
-            print(f"{'='*60}")
-            for key, value in balance.items():
-                print(f"{key.replace('_', ' ').title()}: {value}")
-            
-            if args.symbol:
-                position = bot.get_position(args.symbol)
-                if position:
-                    print(f"\nPosition for {args.symbol}:")
-                    for key, value in position.items():
-                        print(f"  {key.replace('_', ' ').title()}: {value}")
-            print(f"{'='*60}\n")
-        
-        elif args.command == 'cancel':
-            if args.all:
-                success = bot.cancel_all_orders(args.symbol)
-                status = "[OK]" if success else "[ERROR]"
-                print(f"{status} Cancel all orders: {'Success' if success else 'Failed'}")
-            elif args.order_id:
-                success = bot.cancel_order(args.symbol, args.order_id)
-                status = "[OK]" if success else "[ERROR]"
-                print(f"{status} Cancel order {args.order_id}: {'Success' if success else 'Failed'}")
-            else:
-                print("[ERROR] Specify --order-id or --all")
-        
-        elif args.command == 'time-sync':
-            print_time_sync_info()
+        COMMANDS[args.command](bot, args)
     
     except KeyboardInterrupt:
         print("\n\n[WARNING] Operation cancelled by user")
@@ -282,6 +462,8 @@ Examples:
     except Exception as e:
         print(f"\n[ERROR] Error: {e}")
         sys.exit(1)
+    finally:
+        bot.close()
 
 
 if __name__ == '__main__':
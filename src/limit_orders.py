@@ -1,7 +1,6 @@
 """
 Limit Orders - Implementation for limit buy/sell orders
 """
-import logging
 from typing import Dict, Any, Optional
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 from .basic_bot import BasicBot
@@ -10,6 +9,8 @@ from .basic_bot import BasicBot
 class LimitOrders(BasicBot):
     """Handle limit orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_limit_order(
         self,
         symbol: str,
@@ -33,34 +34,11 @@ class LimitOrders(BasicBot):
         Returns:
             Order response dictionary or None if failed
         """
-        # Validation
-        if not self.validate_symbol(symbol):
-            self.logger.error(f"Invalid symbol: {symbol}")
-            return None
-        
-        if side.upper() not in ['BUY', 'SELL']:
-            self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
-            return None
-        
-        if not self.validate_quantity(quantity):
-            self.logger.error(f"Invalid quantity: {quantity}")
-            return None
-        
-        if not self.validate_price(price):
-            self.logger.error(f"Invalid price: {price}")
-            return None
-        
-        if time_in_force not in ['GTC', 'IOC', 'FOK']:
-            self.logger.error(f"Invalid time_in_force: {time_in_force}")
-            return None
-        
-        # Format quantity and price
-        formatted_quantity = self.format_quantity(symbol, quantity)
-        formatted_price = self.format_price(symbol, price)
-        
-        if formatted_quantity is None or formatted_price is None:
-            self.logger.error(f"Failed to format quantity/price for {symbol}")
+        # Validate and format against cached filters
+        preflight = self._preflight(symbol, side, quantity, price, time_in_force, reduce_only)
+        if preflight is None:
             return None
+        formatted_quantity, formatted_price = preflight
         
         # Log request
         self.log_order_request(
@@ -90,13 +68,7 @@ class LimitOrders(BasicBot):
             
             return order
             
-        except BinanceAPIException as e:
-            self.log_error(e, f"placing limit {side} order for {symbol}")
-            return None
-        except BinanceOrderException as e:
-            self.log_error(e, f"placing limit {side} order for {symbol}")
-            return None
-        except Exception as e:
+        except (BinanceAPIException, BinanceOrderException, Exception) as e:
             self.log_error(e, f"placing limit {side} order for {symbol}")
             return None
     
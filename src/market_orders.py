@@ -1,7 +1,6 @@
 """
 Market Orders - Implementation for market buy/sell orders
 """
-import logging
 from typing import Dict, Any, Optional
 from binance.exceptions import BinanceAPIException, BinanceOrderException
 from .basic_bot import BasicBot
@@ -10,6 +9,8 @@ from .basic_bot import BasicBot
 class MarketOrders(BasicBot):
     """Handle market orders for Binance Futures"""
     
+    __slots__ = ()
+    
     def place_market_order(
         self,
         symbol: str,
@@ -29,24 +30,11 @@ class MarketOrders(BasicBot):
         Returns:
             Order response dictionary or None if failed
         """
-        # Validation
-        if not self.validate_symbol(symbol):
-            self.logger.error(f"Invalid symbol: {symbol}")
-            return None
-        
-        if side.upper() not in ['BUY', 'SELL']:
-            self.logger.error(f"Invalid side: {side}. Must be 'BUY' or 'SELL'")
-            return None
-        
-        if not self.validate_quantity(quantity):
-            self.logger.error(f"Invalid quantity: {quantity}")
-            return None
-        
-        # Format quantity
-        formatted_quantity = self.format_quantity(symbol, quantity)
-        if formatted_quantity is None:
-            self.logger.error(f"Failed to format quantity for {symbol}")
+        # Validate and format against cached filters
+        preflight = self._preflight(symbol, side, quantity, reduce_only=reduce_only)
+        if preflight is None:
             return None
+        formatted_quantity = preflight[0]
         
         # Log request
         self.log_order_request(
@@ -72,13 +60,7 @@ class MarketOrders(BasicBot):
             
             return order
             
-        except BinanceAPIException as e:
-            self.log_error(e, f"placing market {side} order for {symbol}")
-            return None
-        except BinanceOrderException as e:
-            self.log_error(e, f"placing market {side} order for {symbol}")
-            return None
-        except Exception as e:
+        except (BinanceAPIException, BinanceOrderException, Exception) as e:
             self.log_error(e, f"placing market {side} order for {symbol}")
             return None
     
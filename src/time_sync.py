@@ -1,9 +1,14 @@
 """
 Time Synchronization Utility for Binance API
 """
+import http.client
 import time
-import requests
-import sys
+
+# orjson parses the response bytes directly; fall back to the stdlib parser without it
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 def check_time_sync(testnet: bool = True) -> dict:
@@ -18,13 +23,17 @@ def check_time_sync(testnet: bool = True) -> dict:
     """
     try:
         if testnet:
-            base_url = 'https://testnet.binancefuture.com'
+            host = 'testnet.binancefuture.com'
         else:
-            base_url = 'https://fapi.binance.com'
+            host = 'fapi.binance.com'
         
-        # Get server time
-        response = requests.get(f'{base_url}/fapi/v1/time', timeout=5)
-        server_time = response.json()['serverTime']
+        # Get server time (stdlib client: one GET doesn't warrant importing requests)
+        conn = http.client.HTTPSConnection(host, timeout=5)
+        try:
+            conn.request('GET', '/fapi/v1/time')
+            server_time = _json_loads(conn.getresponse().read())['serverTime']
+        finally:
+            conn.close()
         
         # Get local time
         local_time = int(time.time() * 1000)
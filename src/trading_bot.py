@@ -1,20 +1,49 @@
 """
 Unified Trading Bot - Combines all order types
 """
+from importlib import import_module
+from typing import Optional
+from binance.client import Client
 from .basic_bot import BasicBot
-from .market_orders import MarketOrders
-from .limit_orders import LimitOrders
-from .advanced.stop_limit import StopLimitOrders
-from .advanced.oco import OCOOrders
-from .advanced.twap import TWAPOrders
-from .advanced.grid import GridOrders
 
 
-class TradingBot(MarketOrders, LimitOrders, StopLimitOrders, OCOOrders, TWAPOrders, GridOrders):
+# Order method -> (module, class) providing it. Order modules are imported, and
+# their methods installed on TradingBot, the first time one of them is used,
+# so e.g. a market order never imports the TWAP/grid/OCO code.
+_METHOD_TO_MIXIN = {
+    'place_market_order': ('.market_orders', 'MarketOrders'),
+    'market_buy': ('.market_orders', 'MarketOrders'),
+    'market_sell': ('.market_orders', 'MarketOrders'),
+    'place_limit_order': ('.limit_orders', 'LimitOrders'),
+    'limit_buy': ('.limit_orders', 'LimitOrders'),
+    'limit_sell': ('.limit_orders', 'LimitOrders'),
+    'place_stop_limit_order': ('.advanced.stop_limit', 'StopLimitOrders'),
+    'stop_limit_buy': ('.advanced.stop_limit', 'StopLimitOrders'),
+    'stop_limit_sell': ('.advanced.stop_limit', 'StopLimitOrders'),
+    'place_oco_order': ('.advanced.oco', 'OCOOrders'),
+    'place_twap_order': ('.advanced.twap', 'TWAPOrders'),
+    'place_grid_orders': ('.advanced.grid', 'GridOrders'),
+}
+
+
+def _install_mixin(cls: type, mixin: type):
+    """
+    Copy mixin's own methods onto cls
+    
+    The order classes only add methods to BasicBot, so installing them
+    directly keeps cls single-inheritance (a two-entry MRO above object)
+    instead of stacking a subclass per order type.
+    """
+    for name, value in vars(mixin).items():
+        if not name.startswith('__') and name not in vars(cls):
+            setattr(cls, name, value)
+
+
+class TradingBot(BasicBot):
     """
     Unified trading bot with all order types
     
-    Inherits from:
+    Order type methods are installed on first use:
     - MarketOrders: Market buy/sell
     - LimitOrders: Limit buy/sell
     - StopLimitOrders: Stop-limit orders
@@ -23,9 +52,20 @@ class TradingBot(MarketOrders, LimitOrders, StopLimitOrders, OCOOrders, TWAPOrde
     - GridOrders: Grid trading orders
     """
     
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
+    __slots__ = ()
+    
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = True, client: Optional[Client] = None):
         """Initialize the unified trading bot"""
-        BasicBot.__init__(self, api_key, api_secret, testnet)
+        BasicBot.__init__(self, api_key, api_secret, testnet, client=client)
+    
+    def __getattr__(self, name: str):
+        """Install the order methods providing name the first time it is accessed"""
+        if name not in _METHOD_TO_MIXIN or name in vars(TradingBot):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        module_name, class_name = _METHOD_TO_MIXIN[name]
+        _install_mixin(TradingBot, getattr(import_module(module_name, __package__), class_name))
+        return getattr(self, name)
     
     def get_account_balance(self) -> dict:
         """Get account balance information"""